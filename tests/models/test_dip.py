@@ -3,6 +3,12 @@ import numpy as np
 from rbamlib.models.dip import B, B0, T, Y
 
 class TestDip(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Equatorial pitch angles from table 1 of Schulz & Lanzerotti (1974)
+        cls.al = np.deg2rad([0, 5.34, 34.38, 90])
+
     def test_B_values(self):
         """Test the dipole magnetic field."""
         r = np.array([1, 2, 3, 3])  # Example r
@@ -33,11 +39,10 @@ class TestDip(unittest.TestCase):
 
     def test_T_values(self):
         """Test the T. Based on table 1 from Schulz & Lanzerotti (1974)"""
-        al = np.deg2rad([0, 5.34, 34.38, 90])  # Example alpha
         expected_output = np.array([1.380, 1.253, 0.959, 0.740])  # Expected T
 
         # Call the T function
-        result = T(al)
+        result = T(self.al)
 
         # Assert that the result is as expected
         np.testing.assert_almost_equal(result, expected_output, decimal=3,
@@ -48,12 +53,10 @@ class TestDip(unittest.TestCase):
         Test the Y. Based on table 1 from Schulz & Lanzerotti (1974). Note, although table 1 provides value for
         alpha = 0, log(sin(alpha)) is undefined, which results in nan
         """
-
-        al = np.deg2rad([0, 5.34, 34.38, 90])  # Example alpha
         expected_output = np.array([np.nan, 2.091, 0.756, 0.000])  # Expected Y
 
-        # Call the Y function
-        result = Y(al)
+        # Call the Y function. Y replaces al == 0 with nan in place, so pass a copy of the shared array
+        result = Y(self.al.copy())
 
         # Assert that the result is as expected
         np.testing.assert_almost_equal(result, expected_output, decimal=3,